@@ -0,0 +1,82 @@
+"""CPU cost of decoding 10k API responses: stdlib json + dict walking vs bot.core.codec + typed models,
+plus decompress + parse per Content-Encoding the codec negotiates.
+
+Run from the repository root: python -m benchmarks.codec_bench
+"""
+import json
+import zlib
+from time import process_time
+
+from bot.core import codec
+from bot.core.models import Balance, Task, UserInfo, parse_datetime
+
+RESPONSES = 10_000
+
+TASKS_BODY = json.dumps([
+    {"id": i, "title": f"Task {i}", "type": "tg" if i % 2 else "link", "link": f"https://t.me/channel_{i}",
+     "channel_id": str(i) if i % 2 else "", "amount": 1000 + i, "hidden": i % 5 == 0, "transaction_id": None}
+    for i in range(30)
+]).encode()
+BALANCE_BODY = json.dumps({"invite": 12000, "tasks": 45000, "game": 3000, "race": "cats"}).encode()
+USER_BODY = json.dumps({"id": 464869246, "race": 1, "claimed_at": "2024-09-20T10:11:12.345Z"}).encode()
+
+
+def compressed_bodies() -> dict:
+    # br is decompressed by aiohttp itself (via brotli), zstd goes through codec.decode_body
+    gzip = zlib.compressobj(wbits=31)
+    bodies = {'gzip': (gzip.compress(TASKS_BODY) + gzip.flush(), lambda body: zlib.decompress(body, wbits=31))}
+    if codec.brotli:
+        bodies['br'] = (codec.brotli.compress(TASKS_BODY), codec.brotli.decompress)
+    if codec.zstandard:
+        bodies['zstd'] = (codec.zstandard.ZstdCompressor().compress(TASKS_BODY),
+                          lambda body: codec.decode_body(body, 'zstd'))
+    return bodies
+
+
+def decode_and_parse(body: bytes, decompress, loads):
+    for _ in range(RESPONSES):
+        loads(decompress(body))
+
+
+def walk_dicts(loads):
+    for _ in range(RESPONSES):
+        tasks = loads(TASKS_BODY)
+        sum(task['amount'] for task in tasks if not task['hidden'] and not task['transaction_id'])
+        sum(value for value in loads(BALANCE_BODY).values() if isinstance(value, int))
+        parse_datetime(loads(USER_BODY)['claimed_at'])
+
+
+def codec_models():
+    for _ in range(RESPONSES):
+        tasks = [Task.from_json(task) for task in codec.loads(TASKS_BODY)]
+        sum(task.amount for task in tasks if not task.hidden and not task.transaction_id)
+        Balance.from_json(codec.loads(BALANCE_BODY)).total
+        UserInfo.from_json(codec.loads(USER_BODY)).claimed_at
+
+
+def measure(func, *args) -> float:
+    start = process_time()
+    func(*args)
+    return process_time() - start
+
+
+def main():
+    print(f"JSON parser: {'orjson' if codec.orjson else 'json (stdlib)'} | Accept-Encoding: {codec.ACCEPT_ENCODING}")
+    baseline = measure(walk_dicts, json.loads)
+    parsing = measure(walk_dicts, codec.loads)
+    current = measure(codec_models)
+    print(f"stdlib json + dicts:   {baseline:.3f}s CPU per {RESPONSES} responses")
+    print(f"codec + dicts:         {parsing:.3f}s CPU per {RESPONSES} responses")
+    print(f"codec + typed models:  {current:.3f}s CPU per {RESPONSES} responses")
+    print(f"saved by parser:       {baseline - parsing:.3f}s ({(1 - parsing / baseline) * 100:.1f}%)")
+    print(f"saved overall:         {baseline - current:.3f}s ({(1 - current / baseline) * 100:.1f}%)")
+
+    for encoding, (body, decompress) in compressed_bodies().items():
+        stdlib = measure(decode_and_parse, body, decompress, json.loads)
+        current = measure(decode_and_parse, body, decompress, codec.loads)
+        print(f"{encoding + ' decode + parse:':<23}{stdlib:.3f}s stdlib json / {current:.3f}s codec "
+              f"per {RESPONSES} responses ({(1 - current / stdlib) * 100:.1f}% saved)")
+
+
+if __name__ == '__main__':
+    main()
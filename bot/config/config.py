@@ -15,5 +15,17 @@ class Settings(BaseSettings):
     REF_ID: str = '464869246'
     DISABLED_TASKS: list[str] = ['INVITE_FRIENDS', 'TON_TRANSACTION', 'BOOST_CHANNEL', 'ACTIVITY_CHALLENGE', 'CONNECT_WALLET']
 
+    ACTIVE_ACCOUNTS_LIMIT: list[int] = [1, 50]
+    ENDPOINT_CONCURRENCY_LIMIT: list[int] = [1, 20]
+    ACTIVE_ACCOUNTS_START: int | None = None
+    ENDPOINT_CONCURRENCY_START: int | None = None
+    LATENCY_TARGET: float = 2.0
+    ERROR_RATE_TARGET: float = 0.05
+    AIMD_DECREASE_FACTOR: float = 0.5
+    AIMD_DECREASE_COOLDOWN: float = 5.0
+    LIMITS_REPORT_INTERVAL: int = 600
+    LOOP_LAG_THRESHOLD: float = 0.5
+    LOOP_WATCHDOG_INTERVAL: float = 0.1
+
 
 settings = Settings()
@@ -0,0 +1,56 @@
+import json
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _build_accept_encoding() -> str:
+    # advertise only what we can actually decode: aiohttp handles gzip/deflate (and br with brotli installed),
+    # zstd is decoded here
+    encodings = ['gzip', 'deflate']
+    if brotli:
+        encodings.append('br')
+    if zstandard:
+        encodings.append('zstd')
+    return ', '.join(encodings)
+
+
+ACCEPT_ENCODING = _build_accept_encoding()
+
+
+def loads(data: bytes | str):
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_body(body: bytes, content_encoding: str) -> bytes:
+    if 'zstd' in content_encoding.lower():
+        if not zstandard:
+            raise ValueError("Response is zstd-encoded but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    return body
+
+
+async def read_json(response: aiohttp.ClientResponse):
+    body = await response.read()
+    return loads(decode_body(body, response.headers.get('Content-Encoding', '')))
+
+
+async def read_text(response: aiohttp.ClientResponse) -> str:
+    body = decode_body(await response.read(), response.headers.get('Content-Encoding', ''))
+    return body.decode(response.charset or 'utf-8', errors='replace')
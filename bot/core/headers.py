@@ -1,7 +1,9 @@
+from .codec import ACCEPT_ENCODING
+
 headers = {
     'Accept': '*/*',
     'Accept-Language': 'ru,en;q=0.9,en-GB;q=0.8,en-US;q=0.7',
-    'Accept-Encoding': 'gzip, deflate, br, zstd',
+    'Accept-Encoding': ACCEPT_ENCODING,
     'Content-Type': 'application/json',
     'Connection': 'keep-alive',
     'Origin': 'https://catsdogs.live',
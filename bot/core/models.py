@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class UserInfo:
+    claimed_at: datetime | None
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'UserInfo':
+        return cls(claimed_at=parse_datetime(data.get('claimed_at')))
+
+
+@dataclass(slots=True)
+class Balance:
+    total: int
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'Balance':
+        return cls(total=sum(value for value in data.values() if isinstance(value, int)))
+
+
+@dataclass(slots=True)
+class Task:
+    id: str
+    title: str
+    type: str
+    link: str
+    channel_id: str | None
+    amount: int
+    hidden: bool
+    transaction_id: str | None
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'Task':
+        # positional on purpose: one of these is built per task per response
+        get = data.get
+        return cls(data['id'], data['title'], data['type'], get('link', ''), get('channel_id', ''),
+                   get('amount', 0), get('hidden', False), get('transaction_id'))
+
+
+@dataclass(slots=True)
+class ClaimResult:
+    success: bool
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'ClaimResult':
+        return cls(success='success' in data.values())
+
+
+def parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    value = value.replace("Z", "+00:00")
+    if '.' in value:
+        # fromisoformat on 3.10 wants exactly 6 fraction digits
+        date_part, rest = value.split('.')
+        time_part, timez = rest.split('+')
+        value = f"{date_part}.{time_part.ljust(6, '0')[:6]}+{timez}"
+    return datetime.fromisoformat(value)
@@ -1,3 +1,5 @@
+import asyncio
+
 from pyrogram import Client
 
 from bot.config import settings
@@ -13,23 +15,23 @@ async def register_sessions() -> None:
     if not API_ID or not API_HASH:
         raise ValueError("API_ID and API_HASH not found in the .env file.")
 
-    session_name = input('\nEnter the session name (press Enter to exit): ')
+    session_name = await asyncio.to_thread(input, '\nEnter the session name (press Enter to exit): ')
 
     if not session_name:
         return None
 
-    raw_proxy = input("Input the proxy in the format type://user:pass:ip:port (press Enter to use without proxy): ")
+    raw_proxy = await asyncio.to_thread(input, "Input the proxy in the format type://user:pass:ip:port (press Enter to use without proxy): ")
     session = await get_tg_client(session_name=session_name, proxy=raw_proxy)
     async with session:
         user_data = await session.get_me()
 
     user_agent = generate_random_user_agent(device_type='android', browser_type='chrome')
-    save_to_json(f'sessions/accounts.json',
-                 dict_={
-                    "session_name": session_name,
-                    "user_agent": user_agent,
-                    "proxy": raw_proxy if raw_proxy else None
-                 })
+    await asyncio.to_thread(save_to_json, 'sessions/accounts.json',
+                            dict_={
+                               "session_name": session_name,
+                               "user_agent": user_agent,
+                               "proxy": raw_proxy if raw_proxy else None
+                            })
     logger.success(f'Session added successfully @{user_data.username} | {user_data.first_name} {user_data.last_name}')
 
 
@@ -2,10 +2,9 @@ import asyncio
 import os
 from datetime import datetime, timedelta, timezone
 from multiprocessing.util import debug
-from time import time
+from time import time, perf_counter
 from urllib.parse import unquote, quote
 
-import brotli
 import aiohttp
 from aiohttp_proxy import ProxyConnector
 from better_proxy import Proxy
@@ -17,10 +16,13 @@ from bot.config import settings
 
 from bot.utils import logger
 from bot.exceptions import InvalidSession
+from .codec import read_json, read_text
 from .headers import headers
+from .models import Balance, ClaimResult, Task, UserInfo
 
 from random import randint, choices
 
+from ..utils.concurrency import controller
 from ..utils.file_manager import get_random_cat_image
 
 
@@ -95,13 +97,27 @@ class Tapper:
             logger.error(f"{self.session_name} | Unknown error during Authorization: {error}")
             await asyncio.sleep(delay=3)
 
+    async def make_request(self, http_client: aiohttp.ClientSession, method: str, url: str, **kwargs):
+        limiter = controller.endpoint(url)
+        async with limiter:
+            start = perf_counter()
+            try:
+                response = await http_client.request(method, url, **kwargs)
+                # aiohttp caches the body, so later read_json/text calls don't touch the network again
+                await response.read()
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError):
+                controller.observe(limiter, perf_counter() - start, status=None)
+                raise
+            controller.observe(limiter, perf_counter() - start, status=response.status)
+            return response
+
     async def login(self, http_client: aiohttp.ClientSession):
         try:
 
-            response = await http_client.get("https://api.catsdogs.live/user/info")
+            response = await self.make_request(http_client, 'GET', "https://api.catsdogs.live/user/info")
 
             if response.status == 404 or response.status == 400:
-                response = await http_client.post("https://api.catsdogs.live/auth/register",
+                response = await self.make_request(http_client, 'POST', "https://api.catsdogs.live/auth/register",
                                                    json={"inviter_id": int(self.start_param), "race": 1})
                 response.raise_for_status()
                 logger.success(f"{self.session_name} | User successfully registered!")
@@ -109,8 +125,7 @@ class Tapper:
                 return await self.login(http_client)
 
             response.raise_for_status()
-            response_json = await response.json()
-            return response_json
+            return UserInfo.from_json(await read_json(response))
 
         except Exception as error:
             logger.error(f"{self.session_name} | Unknown error when logging: {error}")
@@ -119,7 +134,7 @@ class Tapper:
     async def check_proxy(self, http_client: aiohttp.ClientSession, proxy: Proxy) -> None:
         try:
             response = await http_client.get(url='https://ipinfo.io/ip', timeout=aiohttp.ClientTimeout(20))
-            ip = (await response.text())
+            ip = await read_text(response)
             logger.info(f"{self.session_name} | Proxy IP: {ip}")
         except Exception as error:
             logger.error(f"{self.session_name} | Proxy: {proxy} | Error: {error}")
@@ -154,30 +169,30 @@ class Tapper:
 
     async def processing_tasks(self, http_client: aiohttp.ClientSession):
         try:
-            tasks_req = await http_client.get("https://api.catsdogs.live/tasks/list")
+            tasks_req = await self.make_request(http_client, 'GET', "https://api.catsdogs.live/tasks/list")
             tasks_req.raise_for_status()
-            tasks_json = await tasks_req.json()
+            tasks = [Task.from_json(task_json) for task_json in await read_json(tasks_req)]
 
-            for task_json in tasks_json:
-                if not task_json['hidden']:
-                    if not task_json['transaction_id']:
+            for task in tasks:
+                if not task.hidden:
+                    if not task.transaction_id:
                         result = None
-                        if task_json['channel_id'] != '' and task_json['type'] == 'tg':
+                        if task.channel_id != '' and task.type == 'tg':
                             if not settings.JOIN_TG_CHANNELS:
                                 continue
-                            url = task_json['link']
+                            url = task.link
                             logger.info(f"{self.session_name} | Performing TG subscription to <lc>{url}</lc>")
                             await self.join_tg_channel(url)
-                            result = await self.verify_task(http_client, task_json['id'])
-                        elif task_json['type'] != "invite":
-                            logger.info(f"{self.session_name} | Performing <lc>{task_json['title']}</lc> task")
-                            result = await self.verify_task(http_client, task_json['id'])
+                            result = await self.verify_task(http_client, task.id)
+                        elif task.type != "invite":
+                            logger.info(f"{self.session_name} | Performing <lc>{task.title}</lc> task")
+                            result = await self.verify_task(http_client, task.id)
 
                         if result:
-                            logger.success(f"{self.session_name} | Task <lc>{task_json['title']}</lc> completed! |"
-                                           f" Reward: <e>+{task_json['amount']}</e> FOOD")
+                            logger.success(f"{self.session_name} | Task <lc>{task.title}</lc> completed! |"
+                                           f" Reward: <e>+{task.amount}</e> FOOD")
                         else:
-                            logger.info(f"{self.session_name} | Task <lc>{task_json['title']}</lc> not completed")
+                            logger.info(f"{self.session_name} | Task <lc>{task.title}</lc> not completed")
 
                         await asyncio.sleep(delay=randint(5, 10))
 
@@ -187,27 +202,18 @@ class Tapper:
 
     async def get_balance(self, http_client: aiohttp.ClientSession):
         try:
-            balance_req = await http_client.get('https://api.catsdogs.live/user/balance')
+            balance_req = await self.make_request(http_client, 'GET', 'https://api.catsdogs.live/user/balance')
             balance_req.raise_for_status()
-            balance_json = await balance_req.json()
-            balance = 0
-            for value in balance_json.values():
-                if isinstance(value, int):
-                    balance += value
-            return balance
+            return Balance.from_json(await read_json(balance_req)).total
         except Exception as error:
             logger.error(f"{self.session_name} | Unknown error when processing tasks: {error}")
             await asyncio.sleep(delay=3)
 
     async def verify_task(self, http_client: aiohttp.ClientSession, task_id: str, endpoint=""):
         try:
-            response = await http_client.post(f'https://api.catsdogs.live/tasks/claim', json={'task_id': task_id})
+            response = await self.make_request(http_client, 'POST', 'https://api.catsdogs.live/tasks/claim', json={'task_id': task_id})
             response.raise_for_status()
-            response_json = await response.json()
-            for value in response_json.values():
-                if value == 'success':
-                    return True
-            return False
+            return ClaimResult.from_json(await read_json(response)).success
 
         except Exception as e:
             logger.error(f"{self.session_name} | Unknown error while verifying task {task_id} | Error: {e}")
@@ -216,23 +222,12 @@ class Tapper:
     async def claim_reward(self, http_client: aiohttp.ClientSession):
         try:
             result = False
-            last_claimed = await http_client.get('https://api.catsdogs.live/user/info')
+            last_claimed = await self.make_request(http_client, 'GET', 'https://api.catsdogs.live/user/info')
             last_claimed.raise_for_status()
-            last_claimed_json = await last_claimed.json()
-            claimed_at = last_claimed_json['claimed_at']
-            available_to_claim, current_time = None, datetime.now(timezone.utc)
-            if claimed_at:
-                claimed_at = claimed_at.replace("Z", "+00:00")
-                date_part, rest = claimed_at.split('.')
-                time_part, timez = rest.split('+')
-                microseconds = time_part.ljust(6, '0')
-                claimed_at = f"{date_part}.{microseconds}+{timez}"
-
-                available_to_claim = datetime.fromisoformat(claimed_at) + timedelta(hours=8)
-            if not claimed_at or current_time > available_to_claim:
-                response = await http_client.post('https://api.catsdogs.live/game/claim')
+            claimed_at = UserInfo.from_json(await read_json(last_claimed)).claimed_at
+            if not claimed_at or datetime.now(timezone.utc) > claimed_at + timedelta(hours=8):
+                response = await self.make_request(http_client, 'POST', 'https://api.catsdogs.live/game/claim')
                 response.raise_for_status()
-                response_json = await response.json()
                 result = True
 
             return result
@@ -243,11 +238,8 @@ class Tapper:
 
     def generate_random_string(self, length=8):
         characters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
-        random_string = ''
-        for _ in range(length):
-            random_index = int((len(characters) * int.from_bytes(os.urandom(1), 'big')) / 256)
-            random_string += characters[random_index]
-        return random_string
+        # one urandom call for the whole string instead of a syscall per character
+        return ''.join(characters[len(characters) * byte // 256] for byte in os.urandom(length))
 
 
     async def run(self, user_agent: str, proxy: str | None) -> None:
@@ -267,28 +259,29 @@ class Tapper:
             while True:
                 try:
                     if time() - access_token_created_time >= token_live_time:
-                        tg_web_data = await self.get_tg_web_data(proxy=proxy)
-                        if tg_web_data is None:
-                            continue
+                        async with controller.accounts:
+                            tg_web_data = await self.get_tg_web_data(proxy=proxy)
+                            if tg_web_data is None:
+                                continue
 
-                        http_client.headers["X-Telegram-Web-App-Data"] = tg_web_data
-                        user_info = await self.login(http_client=http_client)
-                        access_token_created_time = time()
-                        token_live_time = randint(3500, 3600)
-                        sleep_time = randint(settings.SLEEP_TIME[0], settings.SLEEP_TIME[1])
+                            http_client.headers["X-Telegram-Web-App-Data"] = tg_web_data
+                            user_info = await self.login(http_client=http_client)
+                            access_token_created_time = time()
+                            token_live_time = randint(3500, 3600)
+                            sleep_time = randint(settings.SLEEP_TIME[0], settings.SLEEP_TIME[1])
 
-                        await asyncio.sleep(delay=randint(1, 3))
+                            await asyncio.sleep(delay=randint(1, 3))
 
-                        balance = await self.get_balance(http_client)
-                        logger.info(f"{self.session_name} | Balance: <e>{balance}</e> $FOOD")
+                            balance = await self.get_balance(http_client)
+                            logger.info(f"{self.session_name} | Balance: <e>{balance}</e> $FOOD")
 
-                        if settings.AUTO_TASK:
-                            await asyncio.sleep(delay=randint(5, 10))
-                            await self.processing_tasks(http_client=http_client)
+                            if settings.AUTO_TASK:
+                                await asyncio.sleep(delay=randint(5, 10))
+                                await self.processing_tasks(http_client=http_client)
 
-                        if settings.CLAIM_REWARD:
-                            reward_status = await self.claim_reward(http_client=http_client)
-                            logger.info(f"{self.session_name} | Claim reward: {reward_status}")
+                            if settings.CLAIM_REWARD:
+                                reward_status = await self.claim_reward(http_client=http_client)
+                                logger.info(f"{self.session_name} | Claim reward: {reward_status}")
 
                         logger.info(f"{self.session_name} | Sleep <y>{round(sleep_time / 60, 1)}</y> min")
                         await asyncio.sleep(delay=sleep_time)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from bot.core.agents import generate_random_user_agent
@@ -13,9 +14,9 @@ class Accounts:
         self.api_hash = settings.API_HASH
 
     @staticmethod
-    def get_available_accounts(sessions: list):
+    async def get_available_accounts(sessions: list):
 
-        accounts_from_json = load_from_json('sessions/accounts.json')
+        accounts_from_json = await asyncio.to_thread(load_from_json, 'sessions/accounts.json')
 
         if not accounts_from_json:
             raise ValueError("Can't run script | Please, add account/s in sessions/accounts.json")
@@ -30,24 +31,24 @@ class Accounts:
                     break
             if not is_session_added:
                 logger.warning(f'{session}.session does not exist in sessions/accounts.json')
-                ans = input(f"Add {session} to accounts.json? (y/N): ")
+                ans = await asyncio.to_thread(input, f"Add {session} to accounts.json? (y/N): ")
                 if 'y' in ans.lower():
-                    raw_proxy = input("Input the proxy in the format type://user:pass:ip:port (press Enter to use without proxy): ")
+                    raw_proxy = await asyncio.to_thread(input, "Input the proxy in the format type://user:pass:ip:port (press Enter to use without proxy): ")
                     user_agent = generate_random_user_agent(device_type='android', browser_type='chrome')
                     new_account = {
                          "session_name": session,
                          "user_agent": user_agent,
                          "proxy": raw_proxy
                     }
-                    save_to_json(f'sessions/accounts.json', dict_=new_account)
+                    await asyncio.to_thread(save_to_json, 'sessions/accounts.json', dict_=new_account)
                     available_accounts.append(new_account)
                     logger.success(f'Account {session} added successfully')
 
         return available_accounts
 
-    def pars_sessions(self):
+    async def pars_sessions(self):
         sessions = []
-        for file in os.listdir(self.workdir):
+        for file in await asyncio.to_thread(os.listdir, self.workdir):
             if file.endswith(".session"):
                 sessions.append(file.replace(".session", ""))
 
@@ -55,8 +56,8 @@ class Accounts:
         return sessions
 
     async def get_accounts(self):
-        sessions = self.pars_sessions()
-        available_accounts = self.get_available_accounts(sessions)
+        sessions = await self.pars_sessions()
+        available_accounts = await self.get_available_accounts(sessions)
 
         if not available_accounts:
             raise ValueError("Available accounts not found! Please add accounts in 'sessions' folder")
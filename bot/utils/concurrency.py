@@ -0,0 +1,138 @@
+import asyncio
+from collections import deque
+from time import monotonic
+from urllib.parse import urlsplit
+
+from bot.config import settings
+from bot.utils import logger
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that grows additively while healthy and shrinks multiplicatively on failures (AIMD)."""
+
+    def __init__(self, name: str, min_limit: int, max_limit: int, initial: int | None = None, window: int = 50):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        # start wide open and let the first 429s cut it down
+        initial = self.max_limit if initial is None else initial
+        self.limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self.in_flight = 0
+        self._waiters = deque()
+        self._latencies = deque(maxlen=window)
+        self._failures = deque(maxlen=window)
+        self._last_decrease = 0.0
+
+    @property
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.in_flight < self.current_limit:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        while self._waiters and self.in_flight < self.current_limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    def p95_latency(self) -> float:
+        if not self._latencies:
+            return 0.0
+        latencies = sorted(self._latencies)
+        return latencies[int(0.95 * (len(latencies) - 1))]
+
+    def error_rate(self) -> float:
+        if not self._failures:
+            return 0.0
+        return sum(self._failures) / len(self._failures)
+
+    def record(self, latency: float, failed: bool) -> None:
+        self._latencies.append(latency)
+        self._failures.append(failed)
+
+        if failed:
+            now = monotonic()
+            # one cut per burst of failures, otherwise a single 429 storm would drop the limit to the floor
+            if now - self._last_decrease >= settings.AIMD_DECREASE_COOLDOWN:
+                self._last_decrease = now
+                self.limit = max(float(self.min_limit), self.limit * settings.AIMD_DECREASE_FACTOR)
+            return
+
+        if self.p95_latency() <= settings.LATENCY_TARGET and self.error_rate() <= settings.ERROR_RATE_TARGET:
+            # +1 slot per "round" of limit successful requests
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._wake_up()
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "waiting": sum(1 for waiter in self._waiters if not waiter.done()),
+            "p95_latency": round(self.p95_latency(), 3),
+            "error_rate": round(self.error_rate(), 3),
+        }
+
+
+class ConcurrencyController:
+    """Global limits: how many accounts run a cycle at once and how many requests hit each endpoint at once."""
+
+    def __init__(self):
+        self.accounts = AdaptiveLimiter("accounts", *settings.ACTIVE_ACCOUNTS_LIMIT,
+                                        initial=settings.ACTIVE_ACCOUNTS_START)
+        self._endpoints: dict[str, AdaptiveLimiter] = {}
+
+    def endpoint(self, url: str) -> AdaptiveLimiter:
+        path = urlsplit(url).path or "/"
+        limiter = self._endpoints.get(path)
+        if limiter is None:
+            limiter = AdaptiveLimiter(path, *settings.ENDPOINT_CONCURRENCY_LIMIT,
+                                      initial=settings.ENDPOINT_CONCURRENCY_START)
+            self._endpoints[path] = limiter
+        return limiter
+
+    def observe(self, limiter: AdaptiveLimiter, latency: float, status: int | None) -> None:
+        """Feed a request outcome; status None means the request timed out or the connection failed."""
+        failed = status is None or status == 429 or status >= 500
+        limiter.record(latency, failed)
+        self.accounts.record(latency, failed)
+
+    def snapshot(self) -> dict:
+        return {
+            "accounts": self.accounts.snapshot(),
+            "endpoints": {path: limiter.snapshot() for path, limiter in self._endpoints.items()},
+        }
+
+    async def report(self, interval: int) -> None:
+        while True:
+            await asyncio.sleep(delay=interval)
+            accounts = self.accounts.snapshot()
+            endpoints = ", ".join(f"{path}: {limiter.current_limit}" for path, limiter in self._endpoints.items())
+            logger.info(f"Concurrency | Accounts: <y>{accounts['in_flight']}/{accounts['limit']}</y> "
+                        f"| Endpoints: <y>{endpoints or '-'}</y>")
+
+
+controller = ConcurrencyController()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import mimetypes
 import os
@@ -38,7 +39,8 @@ def save_to_json(path: str, dict_):
 
 
 async def get_random_cat_image(session_name: str):
-    images = [f for f in os.listdir(settings.CATS_PATH) if f.lower().endswith(('.png', '.jpeg', '.jpg'))]
+    images = [f for f in await asyncio.to_thread(os.listdir, settings.CATS_PATH)
+              if f.lower().endswith(('.png', '.jpeg', '.jpg'))]
     if not images:
         logger.warning(f"Please, add cats images in '{settings.CATS_PATH}' folder")
         return None
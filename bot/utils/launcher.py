@@ -9,6 +9,8 @@ from bot.utils import logger
 from bot.core.tapper import run_tapper
 from bot.core.registrator import register_sessions, get_tg_client
 from bot.utils.accounts import Accounts
+from bot.utils.concurrency import controller
+from bot.utils.watchdog import watchdog
 
 
 
@@ -67,11 +69,14 @@ async def process() -> None:
     if action == 2:
         await register_sessions()
     elif action == 1:
+        watchdog_task = asyncio.create_task(watchdog.run())
         accounts = await Accounts().get_accounts()
         await run_tasks(accounts=accounts)
+        watchdog_task.cancel()
 
 
 async def run_tasks(accounts: [Any, Any, list]):
+    reporter = asyncio.create_task(controller.report(interval=settings.LIMITS_REPORT_INTERVAL))
     tasks = []
     for account in accounts:
         session_name, user_agent, raw_proxy = account.values()
@@ -80,4 +85,7 @@ async def run_tasks(accounts: [Any, Any, list]):
         tasks.append(asyncio.create_task(run_tapper(tg_client=tg_client, user_agent=user_agent, proxy=proxy)))
         await asyncio.sleep(delay=randint(settings.START_DELAY[0], settings.START_DELAY[1]))
 
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        reporter.cancel()
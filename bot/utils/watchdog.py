@@ -0,0 +1,71 @@
+import asyncio
+import sys
+import threading
+import traceback
+from time import monotonic
+
+from bot.config import settings
+from bot.utils import logger
+
+
+class LoopWatchdog:
+    """Measures event loop lag and dumps the stack of whatever is blocking the loop when lag exceeds the threshold."""
+
+    def __init__(self, threshold: float, interval: float):
+        self.threshold = threshold
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.lag_events = 0
+        self.stalls = 0
+        self._heartbeat = monotonic()
+        self._reported_heartbeat = None
+        self._loop_thread_id = None
+        self._stopped = threading.Event()
+
+    async def run(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True).start()
+        try:
+            while True:
+                start = monotonic()
+                self._heartbeat = start
+                await asyncio.sleep(delay=self.interval)
+                lag = monotonic() - start - self.interval
+                self.last_lag = lag
+                self.max_lag = max(self.max_lag, lag)
+                if lag > self.threshold:
+                    self.lag_events += 1
+                    # a stall the monitor thread already reported with its stack is only counted
+                    if self._reported_heartbeat != start:
+                        logger.opt(colors=False).warning(f"Event loop lag {round(lag, 3)} sec")
+        finally:
+            self._stopped.set()
+
+    def _monitor(self) -> None:
+        # runs in its own thread, so it still works while the loop is stuck
+        while not self._stopped.wait(timeout=self.interval):
+            heartbeat = self._heartbeat
+            stalled = monotonic() - heartbeat - self.interval
+            if stalled <= self.threshold or heartbeat == self._reported_heartbeat:
+                continue
+
+            self._reported_heartbeat = heartbeat
+            self.stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = ''.join(traceback.format_stack(frame)) if frame else 'unavailable'
+            # stack text contains "<module>"-like chunks, so no color markup here
+            logger.opt(colors=False).warning(f"Event loop blocked for {round(stalled, 3)} sec, "
+                                             f"blocking frame:\n{stack}")
+
+    def snapshot(self) -> dict:
+        return {
+            "last_lag": round(self.last_lag, 3),
+            "max_lag": round(self.max_lag, 3),
+            "lag_events": self.lag_events,
+            "stalls": self.stalls,
+        }
+
+
+watchdog = LoopWatchdog(threshold=settings.LOOP_LAG_THRESHOLD, interval=settings.LOOP_WATCHDOG_INTERVAL)